@@ -56,6 +56,7 @@ class Settings(BaseSettings):
     qb_sandbox: bool = True
     qb_base_url: str = "https://sandbox-quickbooks.api.intuit.com"
     qb_redirect_uri: Optional[str] = "http://localhost:8000/callback"
+    qb_existing_ttl_seconds: int = 300  # Cache TTL for existing-rate lookups per date
     
     # Scheduler Settings
     schedule_time: str = "09:00"  # Daily update time (24h format)
@@ -0,0 +1,49 @@
+"""
+Shared session-scoped fixtures for the root integration test scripts
+
+Each script used to rebuild its own scraper, DB connection and
+QuickBooks client from scratch; these fixtures are created once per
+pytest session and shared.
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.boa_scraper.scraper import BoAScraper
+from src.quickbooks.sync import QuickBooksSync
+
+PROJECT_ROOT = Path(__file__).parent
+
+
+@pytest.fixture(scope="session")
+def scraper():
+    """Shared BoA scraper instance"""
+    return BoAScraper()
+
+
+@pytest.fixture(scope="session")
+def db_conn():
+    """Read-only connection to the application SQLite database"""
+    db_file = PROJECT_ROOT / "data" / "boa_exchange.db"
+    if not db_file.exists():
+        pytest.skip(f"Database not found at {db_file}")
+    conn = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(scope="session")
+def qb_sync():
+    """Shared QuickBooks sync service (skips when not configured)"""
+    sync = QuickBooksSync()
+    if not sync.client:
+        pytest.skip("QuickBooks credentials not configured")
+    return sync
+
+
+@pytest.fixture(scope="session")
+def qb_client(qb_sync):
+    """QuickBooks API client from the shared sync service"""
+    return qb_sync.client
@@ -20,7 +20,7 @@ from ..api.admin_schemas import (
 )
 from ..utils.admin_auth import (
     authenticate_admin, create_access_token, get_password_hash,
-    get_current_admin, get_current_superadmin
+    get_current_admin, get_current_superadmin, invalidate_admin_cache
 )
 from ..utils.logger import get_logger
 
@@ -112,7 +112,10 @@ async def create_admin(
     db.add(new_admin)
     db.commit()
     db.refresh(new_admin)
-    
+
+    # Make sure stale lookups for this username don't linger
+    invalidate_admin_cache(new_admin.username)
+
     # Log activity
     log_activity(db, current_admin, "create_admin", "admin", str(new_admin.id), 
                  f"Created admin: {new_admin.username}", request.client.host)
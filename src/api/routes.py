@@ -16,7 +16,9 @@ from .schemas import (
     ErrorResponse
 )
 from ..boa_scraper.scraper import BoAScraper
+from ..boa_scraper.models import DailyExchangeRates
 from ..quickbooks.sync import QuickBooksSync
+from ..utils import rate_cache
 from ..utils.scheduler import trigger_manual_update
 from ..utils.logger import get_logger
 
@@ -45,12 +47,18 @@ async def get_current_rates(priority_only: bool = False):
     """
     try:
         scraper = BoAScraper()
-        
-        if priority_only:
-            daily_rates = scraper.get_priority_rates()
-        else:
-            daily_rates = scraper.get_current_rates()
-        
+        daily_rates = rate_cache.get_or_scrape(scraper)
+
+        if daily_rates and priority_only:
+            daily_rates = DailyExchangeRates(
+                rates_date=daily_rates.rates_date,
+                rates=[
+                    rate for rate in daily_rates.rates
+                    if rate.currency_code in BoAScraper.PRIORITY_CURRENCIES
+                ],
+                source=daily_rates.source
+            )
+
         if not daily_rates:
             raise HTTPException(
                 status_code=404,
@@ -75,6 +83,8 @@ async def get_current_rates(priority_only: bool = False):
             total_rates=len(rate_responses)
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting current rates: {str(e)}")
         raise HTTPException(
@@ -88,8 +98,14 @@ async def get_rates_for_date(target_date: date):
     """Get exchange rates for a specific date"""
     try:
         scraper = BoAScraper()
-        daily_rates = scraper.get_rates_for_date(target_date)
-        
+
+        # Today's rates come from the shared TTL cache; historical dates
+        # still go to the scraper directly
+        if target_date == date.today():
+            daily_rates = rate_cache.get_or_scrape(scraper)
+        else:
+            daily_rates = scraper.get_rates_for_date(target_date)
+
         if not daily_rates:
             raise HTTPException(
                 status_code=404,
@@ -114,6 +130,8 @@ async def get_rates_for_date(target_date: date):
             total_rates=len(rate_responses)
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting rates for {target_date}: {str(e)}")
         raise HTTPException(
@@ -147,7 +165,9 @@ async def trigger_sync(sync_request: SyncRequest = None):
                     errors=[result.get('error', 'Unknown error')]
                 )
         else:
-            # Current day sync
+            # Current day sync - drop cached rates first so the forced
+            # update scrapes fresh data instead of serving the cache
+            rate_cache.invalidate()
             success = trigger_manual_update()
             
             if success:
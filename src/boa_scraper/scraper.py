@@ -21,6 +21,8 @@ Data available from BoA website:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from datetime import date, datetime
 from typing import List, Optional, Dict, Tuple
@@ -33,6 +35,29 @@ from ..utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _build_session() -> requests.Session:
+    """Build the shared HTTP session with connection pooling and retries"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Connection': 'keep-alive',
+    })
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared across scraper instances so the TLS connection to
+# bankofalbania.org is reused instead of re-handshaking every time a
+# request handler or the scheduler constructs a fresh BoAScraper
+_SESSION = _build_session()
+
+
 class BoAScraper:
     """
     Bank of Albania exchange rate scraper
@@ -101,13 +126,25 @@ class BoAScraper:
         'SDR': 'SDR',
         'Të drejtat speciale të tërheqjes': 'SDR',
     }
-    
+
+    # Code to display-name mapping - built once at class level instead of
+    # per _get_currency_name call
+    CURRENCY_NAMES = {
+        'USD': 'Dollar Amerikan (US Dollar)',
+        'EUR': 'Euro',
+        'GBP': 'Poundi Britanik (British Pound)',
+        'CHF': 'Franga Zvicerane (Swiss Franc)',
+        'CAD': 'Canadian Dollar',
+        'JPY': 'Japanese Yen',
+        'AUD': 'Australian Dollar',
+        'SEK': 'Swedish Krona',
+        'NOK': 'Norwegian Krone',
+        'DKK': 'Danish Krone',
+    }
+
     def __init__(self, base_url: str = "https://www.bankofalbania.org"):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.session = _SESSION
     
     def get_current_rates(self) -> Optional[DailyExchangeRates]:
         """
@@ -396,20 +433,7 @@ class BoAScraper:
         Returns:
             Full currency name
         """
-        currency_names = {
-            'USD': 'Dollar Amerikan (US Dollar)',
-            'EUR': 'Euro',
-            'GBP': 'Poundi Britanik (British Pound)',
-            'CHF': 'Franga Zvicerane (Swiss Franc)',
-            'CAD': 'Canadian Dollar',
-            'JPY': 'Japanese Yen',
-            'AUD': 'Australian Dollar',
-            'SEK': 'Swedish Krona',
-            'NOK': 'Norwegian Krone',
-            'DKK': 'Danish Krone',
-        }
-        
-        return currency_names.get(currency_code, currency_code)
+        return self.CURRENCY_NAMES.get(currency_code, currency_code)
     
     def get_priority_rates(self) -> Optional[DailyExchangeRates]:
         """
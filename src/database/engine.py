@@ -2,7 +2,7 @@
 Database engine and session management
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.pool import NullPool
 from contextlib import contextmanager
@@ -60,6 +60,18 @@ class DatabaseManager:
                     connect_args={'check_same_thread': False},  # Allow multi-threading
                     poolclass=NullPool  # SQLite doesn't need connection pooling
                 )
+
+                # WAL lets readers proceed while a write is in flight, and
+                # the remaining pragmas are the standard SQLite hot-path
+                # tuning (fewer fsyncs, in-memory temp tables, mmap reads)
+                @event.listens_for(self.engine, 'connect')
+                def _set_sqlite_pragmas(dbapi_connection, connection_record):
+                    cursor = dbapi_connection.cursor()
+                    cursor.execute('PRAGMA journal_mode=WAL')
+                    cursor.execute('PRAGMA synchronous=NORMAL')
+                    cursor.execute('PRAGMA temp_store=MEMORY')
+                    cursor.execute('PRAGMA mmap_size=268435456')
+                    cursor.close()
             else:
                 # PostgreSQL/MySQL configuration
                 self.engine = create_engine(
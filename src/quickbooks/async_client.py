@@ -0,0 +1,294 @@
+"""
+Asynchronous QuickBooks Online API client
+
+Drop-in async counterpart to QuickBooksClient for asyncio callers. Uses a
+shared aiohttp session with a bounded connector, so many requests can be
+in flight concurrently over kept-alive connections instead of being
+serialized behind a blocking session.
+
+Usage:
+    async with AsyncQuickBooksClient(...) as client:
+        rates = await client.get_existing_exchange_rates(date.today())
+"""
+
+import aiohttp
+from typing import Optional, List, Dict, Any
+from datetime import date
+from decimal import Decimal
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncQuickBooksClient:
+    """Asynchronous QuickBooks Online API client wrapper"""
+
+    # QB batch endpoint accepts at most 30 operations per request
+    BATCH_MAX_OPERATIONS = 30
+
+    def __init__(self,
+                 client_id: str,
+                 client_secret: str,
+                 access_token: str,
+                 refresh_token: str,
+                 company_id: str,
+                 sandbox: bool = True,
+                 connection_limit: int = 32):
+        """
+        Initialize async QuickBooks client
+
+        Args:
+            client_id: QB app client ID
+            client_secret: QB app client secret
+            access_token: User access token
+            refresh_token: User refresh token
+            company_id: Company ID (realm ID)
+            sandbox: Whether to use sandbox environment
+            connection_limit: Maximum concurrent connections in the pool
+        """
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.company_id = company_id
+        self.sandbox = sandbox
+        self.connection_limit = connection_limit
+
+        # Set base URL based on environment
+        self.base_url = (
+            "https://sandbox-quickbooks.api.intuit.com/v3"
+            if sandbox
+            else "https://quickbooks.api.intuit.com/v3"
+        )
+
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncQuickBooksClient":
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared aiohttp session lazily"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={
+                    'Authorization': f'Bearer {self.access_token}',
+                    'Accept': 'application/json',
+                    'Content-Type': 'application/json'
+                }
+            )
+        return self._session
+
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _request_json(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        """Issue a request and return the decoded JSON body"""
+        session = await self._ensure_session()
+        async with session.request(method, url, **kwargs) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    async def test_connection(self) -> bool:
+        """
+        Test the connection to QuickBooks API
+
+        Returns:
+            True if connection is successful, False otherwise
+        """
+        try:
+            url = f"{self.base_url}/company/{self.company_id}/companyinfo/{self.company_id}"
+            company_info = await self._request_json('GET', url)
+
+            company_name = company_info.get('CompanyInfo', {}).get('CompanyName', 'Unknown')
+            logger.info(f"Connected to QuickBooks company: {company_name}")
+            return True
+        except Exception as e:
+            logger.error(f"QuickBooks connection test failed: {str(e)}")
+            return False
+
+    async def get_existing_exchange_rate(self,
+                                         source_currency: str,
+                                         target_date: date) -> Optional[Dict[str, Any]]:
+        """
+        Get existing exchange rate for a specific currency and date
+
+        Args:
+            source_currency: Source currency code (e.g., 'USD')
+            target_date: Date to query
+
+        Returns:
+            Exchange rate data including SyncToken if found, None otherwise
+        """
+        try:
+            date_str = target_date.strftime("%Y-%m-%d")
+            url = f"{self.base_url}/company/{self.company_id}/exchangerate"
+            params = {
+                'sourcecurrencycode': source_currency,
+                'asofdate': date_str
+            }
+
+            session = await self._ensure_session()
+            async with session.get(url, params=params) as response:
+                # 404 means no rate exists for this currency/date combo - that's ok
+                if response.status == 404:
+                    logger.debug(f"No existing rate for {source_currency} on {date_str}")
+                    return None
+
+                response.raise_for_status()
+                data = await response.json()
+
+            return data.get('ExchangeRate')
+
+        except Exception as e:
+            logger.error(f"Error querying existing exchange rate: {str(e)}")
+            return None
+
+    async def get_existing_exchange_rates(self, target_date: date) -> List[Dict[str, Any]]:
+        """
+        Get all existing exchange rates for a specific date in a single query
+
+        Args:
+            target_date: Date to query
+
+        Returns:
+            List of existing exchange rate records for that date
+        """
+        try:
+            date_str = target_date.strftime("%Y-%m-%d")
+            url = f"{self.base_url}/company/{self.company_id}/query"
+            params = {'query': f"select * from exchangerate where asofdate = '{date_str}'"}
+
+            data = await self._request_json('POST', url, params=params)
+            return data.get('QueryResponse', {}).get('ExchangeRate', [])
+
+        except Exception as e:
+            logger.error(f"Error querying existing exchange rates: {str(e)}")
+            return []
+
+    async def create_or_update_exchange_rate(self,
+                                             source_currency: str,
+                                             target_currency: str,
+                                             rate: Decimal,
+                                             as_of_date: date,
+                                             existing_rate: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Create or update an exchange rate in QuickBooks
+
+        Args:
+            source_currency: Source currency code (e.g., 'USD')
+            target_currency: Target currency code (e.g., 'ALL' for Albanian Lek)
+            rate: Exchange rate (units of target currency per 1 unit of source)
+            as_of_date: Effective date of the rate
+            existing_rate: Pre-fetched existing rate record, if any
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            date_str = as_of_date.strftime("%Y-%m-%d")
+
+            payload = {
+                "SourceCurrencyCode": source_currency,
+                "Rate": float(rate),
+                "AsOfDate": date_str,
+                "SyncToken": existing_rate.get("SyncToken", "0") if existing_rate else "0"
+            }
+            if target_currency and target_currency != source_currency:
+                payload["TargetCurrencyCode"] = target_currency
+
+            url = f"{self.base_url}/company/{self.company_id}/exchangerate"
+            result = await self._request_json('POST', url, json=payload)
+
+            exchange_rate = result.get('ExchangeRate', {})
+            logger.info(
+                f"{'Updated' if existing_rate else 'Created'} exchange rate: "
+                f"{source_currency}/{target_currency} = {rate} "
+                f"(as of {date_str}, SyncToken: {exchange_rate.get('SyncToken', 'unknown')})"
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error creating/updating exchange rate: {str(e)}")
+            return False
+
+    async def batch_create_or_update_exchange_rates(self,
+                                                    items: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Submit multiple exchange rate create/update operations in batch requests
+
+        Args:
+            items: List of dicts with 'bId', 'operation' and 'ExchangeRate' keys
+                   (same shape as the synchronous client)
+
+        Returns:
+            Dictionary mapping each bId to True/False per-item success
+        """
+        results: Dict[str, bool] = {}
+        url = f"{self.base_url}/company/{self.company_id}/batch"
+
+        for start in range(0, len(items), self.BATCH_MAX_OPERATIONS):
+            chunk = items[start:start + self.BATCH_MAX_OPERATIONS]
+
+            try:
+                data = await self._request_json('POST', url, json={"BatchItemRequest": chunk})
+
+                for item_response in data.get('BatchItemResponse', []):
+                    b_id = item_response.get('bId', '')
+                    if 'Fault' in item_response:
+                        errors = item_response['Fault'].get('Error', [])
+                        detail = errors[0].get('Message', 'Unknown error') if errors else 'Unknown error'
+                        logger.error(f"Batch item {b_id} failed: {detail}")
+                        results[b_id] = False
+                    else:
+                        results[b_id] = True
+
+            except Exception as e:
+                logger.error(f"Error submitting exchange rate batch: {str(e)}")
+                for item in chunk:
+                    results[item.get('bId', '')] = False
+
+        return results
+
+    async def add_currency(self, currency_code: str) -> bool:
+        """
+        Add a currency to the active currency list
+
+        Args:
+            currency_code: ISO 4217 currency code (e.g., 'USD', 'EUR')
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            url = f"{self.base_url}/company/{self.company_id}/companycurrency"
+
+            session = await self._ensure_session()
+            async with session.post(url, json={"Code": currency_code}) as response:
+                if response.status == 400:
+                    # Currency might already exist
+                    logger.warning(f"Currency {currency_code} may already be active")
+                    return True
+
+                response.raise_for_status()
+                result = await response.json()
+
+            currency = result.get('CompanyCurrency', {})
+            logger.info(f"Added currency: {currency.get('Code')} - {currency.get('Name')}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error adding currency: {str(e)}")
+            return False
@@ -3,6 +3,8 @@ QuickBooks Online API client
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, List, Dict, Any
 from datetime import date, datetime
 from decimal import Decimal
@@ -11,6 +13,9 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Sentinel distinguishing "no prefetched rate supplied" from "prefetched and absent"
+_UNSET = object()
+
 
 class QuickBooksClient:
     """QuickBooks Online API client wrapper"""
@@ -47,8 +52,19 @@ class QuickBooksClient:
             else "https://quickbooks.api.intuit.com/v3"
         )
         
-        # Initialize session with headers
+        # Initialize session with headers and a persistent connection pool
+        # so sequential syncs reuse the same TLS connection (keep-alive)
+        # instead of paying a TCP+TLS handshake per call
         self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        ))
         self.session.headers.update({
             'Authorization': f'Bearer {self.access_token}',
             'Accept': 'application/json',
@@ -149,24 +165,43 @@ class QuickBooksClient:
     
     def get_existing_exchange_rates(self, target_date: date) -> List[Dict[str, Any]]:
         """
-        Get existing exchange rates for a specific date (kept for compatibility)
-        
+        Get all existing exchange rates for a specific date in a single query
+
+        Per QB API: POST /company/<realmId>/query with "select * from exchangerate"
+        (same query endpoint used for companycurrency lookups). Fetching the full
+        list once per date avoids one GET per currency during a sync run.
+
         Args:
             target_date: Date to query
-            
+
         Returns:
-            List of existing exchange rate records
+            List of existing exchange rate records for that date
         """
-        # Note: QB doesn't provide a query-all-rates-for-date endpoint
-        # This would need to iterate through known currencies
-        # For now, return empty list and handle per-currency queries
-        return []
+        try:
+            date_str = target_date.strftime("%Y-%m-%d")
+            url = f"{self.base_url}/company/{self.company_id}/query"
+            params = {'query': f"select * from exchangerate where asofdate = '{date_str}'"}
+
+            response = self.session.post(url, params=params)
+            response.raise_for_status()
+
+            data = response.json()
+            query_response = data.get('QueryResponse', {})
+            exchange_rates = query_response.get('ExchangeRate', [])
+
+            logger.debug(f"Found {len(exchange_rates)} existing rates for {date_str}")
+            return exchange_rates
+
+        except Exception as e:
+            logger.error(f"Error querying existing exchange rates: {str(e)}")
+            return []
     
-    def create_or_update_exchange_rate(self, 
+    def create_or_update_exchange_rate(self,
                                        source_currency: str,
                                        target_currency: str,
                                        rate: Decimal,
-                                       as_of_date: date) -> bool:
+                                       as_of_date: date,
+                                       existing_rate: Optional[Dict[str, Any]] = _UNSET) -> bool:
         """
         Create or update an exchange rate in QuickBooks
         
@@ -190,14 +225,18 @@ class QuickBooksClient:
                            Defaults to home currency if not supplied
             rate: Exchange rate (units of target currency per 1 unit of source)
             as_of_date: Effective date of the rate
-            
+            existing_rate: Pre-fetched existing rate record (or None if known absent).
+                          When omitted, the rate is looked up per-currency as before.
+
         Returns:
             True if successful, False otherwise
         """
         try:
             # Check if rate already exists to get SyncToken
-            existing_rate = self.get_existing_exchange_rate(source_currency, as_of_date)
-            
+            # (skipped when the caller already batch-fetched existing rates)
+            if existing_rate is _UNSET:
+                existing_rate = self.get_existing_exchange_rate(source_currency, as_of_date)
+
             date_str = as_of_date.strftime("%Y-%m-%d")
             
             # Build request payload per QB API documentation
@@ -256,7 +295,55 @@ class QuickBooksClient:
             logger.error(f"Error creating/updating exchange rate: {str(e)}")
             return False
     
-    def create_exchange_rate(self, 
+    # QB batch endpoint accepts at most 30 operations per request
+    BATCH_MAX_OPERATIONS = 30
+
+    def batch_create_or_update_exchange_rates(self,
+                                              items: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Submit multiple exchange rate create/update operations in batch requests
+
+        Per QB API: POST /company/<realmId>/batch accepts up to 30 operations
+        per call, cutting one HTTP round-trip per rate down to one per 30 rates.
+
+        Args:
+            items: List of dicts with keys:
+                   - 'bId': batch item id (the currency code works well)
+                   - 'operation': 'create' or 'update'
+                   - 'ExchangeRate': the exchange rate payload
+
+        Returns:
+            Dictionary mapping each bId to True/False per-item success
+        """
+        results: Dict[str, bool] = {}
+        url = f"{self.base_url}/company/{self.company_id}/batch"
+
+        for start in range(0, len(items), self.BATCH_MAX_OPERATIONS):
+            chunk = items[start:start + self.BATCH_MAX_OPERATIONS]
+
+            try:
+                response = self.session.post(url, json={"BatchItemRequest": chunk})
+                response.raise_for_status()
+
+                data = response.json()
+                for item_response in data.get('BatchItemResponse', []):
+                    b_id = item_response.get('bId', '')
+                    if 'Fault' in item_response:
+                        errors = item_response['Fault'].get('Error', [])
+                        detail = errors[0].get('Message', 'Unknown error') if errors else 'Unknown error'
+                        logger.error(f"Batch item {b_id} failed: {detail}")
+                        results[b_id] = False
+                    else:
+                        results[b_id] = True
+
+            except Exception as e:
+                logger.error(f"Error submitting exchange rate batch: {str(e)}")
+                for item in chunk:
+                    results[item.get('bId', '')] = False
+
+        return results
+
+    def create_exchange_rate(self,
                            source_currency: str,
                            target_currency: str,
                            rate: Decimal,
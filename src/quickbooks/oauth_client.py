@@ -5,8 +5,9 @@ QuickBooks OAuth2 Authentication Client
 from intuitlib.client import AuthClient
 from intuitlib.enums import Scopes
 from intuitlib.exceptions import AuthClientError
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import requests
+import time
 
 from ..utils.logger import get_logger
 from config.settings import settings
@@ -16,10 +17,28 @@ logger = get_logger(__name__)
 
 class QuickBooksOAuthClient:
     """QuickBooks OAuth2 authentication client"""
-    
+
+    # User and company info are stable for hours; cache them briefly so
+    # back-to-back lookups don't each pay an Intuit round-trip
+    INFO_CACHE_TTL_SECONDS = 300
+
     def __init__(self):
         self.auth_client = None
+        # {(kind, key): (monotonic timestamp, payload)}
+        self._info_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
         self.initialize_client()
+
+    def _cached_info(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached info payload if it is still fresh"""
+        cached = self._info_cache.get((kind, key))
+        if cached and time.monotonic() - cached[0] < self.INFO_CACHE_TTL_SECONDS:
+            logger.debug(f"Serving {kind} info from cache")
+            return cached[1]
+        return None
+
+    def _store_info(self, kind: str, key: str, payload: Dict[str, Any]):
+        """Cache an info payload"""
+        self._info_cache[(kind, key)] = (time.monotonic(), payload)
     
     def initialize_client(self) -> bool:
         """Initialize the OAuth client"""
@@ -88,7 +107,11 @@ class QuickBooksOAuthClient:
             if not token:
                 logger.error("No access token available for user info request")
                 return None
-            
+
+            cached = self._cached_info('user', token)
+            if cached is not None:
+                return cached
+
             # Create a new auth client instance for this request if needed
             if access_token and access_token != getattr(self.auth_client, 'access_token', None):
                 temp_client = AuthClient(
@@ -108,6 +131,7 @@ class QuickBooksOAuthClient:
             if response and response.status_code == 200:
                 user_info = response.json()
                 logger.info("Successfully retrieved user information")
+                self._store_info('user', token, user_info)
                 return user_info
             else:
                 logger.error(f"Failed to get user info: {response.status_code if response else 'No response'}")
@@ -223,12 +247,20 @@ class QuickBooksOAuthClient:
             return None
     
     def get_company_info(self, realm_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Get company information"""
+        """Get company information (cached with a short TTL)"""
         company_id = realm_id or settings.qb_company_id
+
+        cached = self._cached_info('company', str(company_id))
+        if cached is not None:
+            return cached
+
         response = self.make_api_request(f'companyinfo/{company_id}', realm_id=realm_id)
-        
+
         if response and 'QueryResponse' in response:
             company_info = response['QueryResponse'].get('CompanyInfo', [])
-            return company_info[0] if company_info else None
-        
+            if company_info:
+                self._store_info('company', str(company_id), company_info[0])
+                return company_info[0]
+            return None
+
         return None
\ No newline at end of file
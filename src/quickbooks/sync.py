@@ -2,8 +2,10 @@
 QuickBooks Online synchronization service
 """
 
-from typing import List, Optional, Dict, Any
-from datetime import date, datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import date, datetime, timedelta
 from decimal import Decimal
 
 from .client import QuickBooksClient
@@ -20,6 +22,9 @@ class QuickBooksSync:
     def __init__(self):
         """Initialize the sync service"""
         self.client = None
+        # Cache of existing-rate lookups keyed by ISO date, so retries and
+        # overlapping syncs within the TTL skip the redundant network fetch
+        self._existing_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
         self._initialize_client()
     
     def _initialize_client(self):
@@ -71,22 +76,17 @@ class QuickBooksSync:
         
         try:
             logger.info(f"Syncing {len(daily_rates.rates)} exchange rates for {daily_rates.rates_date}")
-            
-            success_count = 0
-            error_count = 0
-            
-            for rate in daily_rates.rates:
-                try:
-                    success = self._sync_single_rate(rate)
-                    if success:
-                        success_count += 1
-                    else:
-                        error_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error syncing rate {rate.currency_code}: {str(e)}")
-                    error_count += 1
-            
+
+            # Fetch existing rates once for the whole date instead of once per rate
+            existing = self._get_existing_rates_cached(daily_rates.rates_date)
+            existing_map = {
+                e['SourceCurrencyCode']: e
+                for e in existing
+                if e.get('TargetCurrencyCode', 'ALL') == 'ALL'
+            }
+
+            success_count, error_count = self._sync_batch(daily_rates.rates, existing_map)
+
             logger.info(f"Sync completed: {success_count} successful, {error_count} errors")
             return error_count == 0
             
@@ -94,68 +94,103 @@ class QuickBooksSync:
             logger.error(f"Error during sync process: {str(e)}")
             return False
     
-    def _sync_single_rate(self, rate: ExchangeRate, home_currency: str = 'ALL') -> bool:
+    def _get_existing_rates_cached(self, target_date: date) -> List[Dict[str, Any]]:
         """
-        Sync a single exchange rate to QuickBooks
-        
-        Per QB multicurrency docs:
-        - Exchange rates are stored as: rate = units of home currency per 1 foreign currency unit
-        - For BoA rates: if rate.rate = 100 (100 ALL per 1 USD), that's the format QB expects
-        
+        Get existing QB rates for a date, cached with a short TTL
+
+        Repeated syncs for the same date (retries, overlapping cron runs,
+        historical backfills) reuse the cached list instead of re-querying.
+
+        Args:
+            target_date: Date to look up
+
+        Returns:
+            List of existing exchange rate records for that date
+        """
+        cache_key = target_date.isoformat()
+        ttl = settings.qb_existing_ttl_seconds
+
+        cached = self._existing_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            logger.debug(f"Using cached existing rates for {cache_key}")
+            return cached[1]
+
+        existing = self.client.get_existing_exchange_rates(target_date)
+        self._existing_cache[cache_key] = (time.monotonic(), existing)
+        return existing
+
+    def _sync_batch(self,
+                    rates: List[ExchangeRate],
+                    existing_map: Dict[str, Dict[str, Any]],
+                    home_currency: str = 'ALL') -> Tuple[int, int]:
+        """
+        Sync a list of exchange rates via the QB batch endpoint
+
+        Packs all create/update operations into batch requests (30 ops per
+        HTTP call) instead of posting each rate individually.
+
         Args:
-            rate: Exchange rate to sync
+            rates: Exchange rates to sync
+            existing_map: Existing QB rates for the date, keyed by SourceCurrencyCode
             home_currency: Home currency code (default 'ALL' for Albanian Lek)
-            
+
         Returns:
-            True if successful, False otherwise
+            Tuple of (success_count, error_count)
         """
-        try:
+        items = []
+
+        for rate in rates:
             # Ensure the currency is in the active currency list first
             # This is important - currencies must be active before posting rates
             self.client.add_currency(rate.currency_code)
-            
-            # Post the exchange rate
-            # The rate from BoA is already in the correct format:
-            # units of ALL (home) per 1 unit of foreign currency
-            success = self.client.create_or_update_exchange_rate(
-                source_currency=rate.currency_code,
-                target_currency=home_currency,
-                rate=rate.rate,
-                as_of_date=rate.rate_date
-            )
-            
-            if success:
-                logger.debug(
-                    f"Synced rate for {rate.currency_code}/{home_currency} = {rate.rate} "
-                    f"on {rate.rate_date}"
-                )
-            else:
-                logger.error(f"Failed to sync rate for {rate.currency_code}")
-            
-            return success
-                    
-        except Exception as e:
-            logger.error(f"Error syncing rate for {rate.currency_code}: {str(e)}")
-            return False
-    
+
+            existing_rate = existing_map.get(rate.currency_code)
+            payload = {
+                "SourceCurrencyCode": rate.currency_code,
+                "TargetCurrencyCode": home_currency,
+                "Rate": float(rate.rate),
+                "AsOfDate": rate.rate_date.strftime("%Y-%m-%d"),
+                "SyncToken": existing_rate.get("SyncToken", "0") if existing_rate else "0"
+            }
+            items.append({
+                "bId": rate.currency_code,
+                "operation": "update" if existing_rate else "create",
+                "ExchangeRate": payload
+            })
+
+        results = self.client.batch_create_or_update_exchange_rates(items)
+
+        success_count = sum(1 for ok in results.values() if ok)
+        error_count = len(items) - success_count
+        return success_count, error_count
+
+    # Bounded concurrency for historical backfills - each day is independent
+    # (scrape + sync), so a few days can be in flight at once without
+    # hammering BoA or the QB rate limits
+    HISTORICAL_SYNC_WORKERS = 5
+
     def sync_historical_rates(self, start_date: date, end_date: date) -> Dict[str, Any]:
         """
         Sync historical exchange rates for a date range
-        
+
+        Days are processed concurrently with a bounded worker pool, so a
+        long backfill takes roughly (days / workers) x per-day latency
+        instead of serializing every scrape and sync.
+
         Args:
             start_date: Start date for sync
             end_date: End date for sync
-            
+
         Returns:
             Dictionary with sync results
         """
         if not self.client:
             logger.error("QuickBooks client not initialized")
             return {'success': False, 'error': 'Client not initialized'}
-        
+
         try:
             from ..boa_scraper.scraper import BoAScraper
-            
+
             scraper = BoAScraper()
             results = {
                 'success': True,
@@ -163,33 +198,46 @@ class QuickBooksSync:
                 'failed_dates': [],
                 'total_rates': 0
             }
-            
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    daily_rates = scraper.get_rates_for_date(current_date)
-                    
-                    if daily_rates:
-                        sync_success = self.sync_rates(daily_rates)
-                        
+
+            dates = [
+                start_date + timedelta(days=i)
+                for i in range((end_date - start_date).days + 1)
+            ]
+
+            def sync_one_day(day: date) -> Tuple[date, bool, int]:
+                daily_rates = scraper.get_rates_for_date(day)
+
+                if not daily_rates:
+                    logger.warning(f"No rates found for {day}")
+                    return day, False, 0
+
+                sync_success = self.sync_rates(daily_rates)
+                return day, sync_success, len(daily_rates.rates)
+
+            with ThreadPoolExecutor(max_workers=self.HISTORICAL_SYNC_WORKERS) as executor:
+                futures = {executor.submit(sync_one_day, day): day for day in dates}
+
+                for future in as_completed(futures):
+                    day = futures[future]
+                    try:
+                        day, sync_success, rate_count = future.result()
+
                         if sync_success:
-                            results['synced_dates'].append(current_date.isoformat())
-                            results['total_rates'] += len(daily_rates.rates)
+                            results['synced_dates'].append(day.isoformat())
+                            results['total_rates'] += rate_count
                         else:
-                            results['failed_dates'].append(current_date.isoformat())
-                    else:
-                        logger.warning(f"No rates found for {current_date}")
-                        results['failed_dates'].append(current_date.isoformat())
-                        
-                except Exception as e:
-                    logger.error(f"Error syncing rates for {current_date}: {str(e)}")
-                    results['failed_dates'].append(current_date.isoformat())
-                
-                # Move to next day
-                current_date = date.fromordinal(current_date.toordinal() + 1)
-            
+                            results['failed_dates'].append(day.isoformat())
+
+                    except Exception as e:
+                        logger.error(f"Error syncing rates for {day}: {str(e)}")
+                        results['failed_dates'].append(day.isoformat())
+
+            # Keep result ordering deterministic despite concurrent completion
+            results['synced_dates'].sort()
+            results['failed_dates'].sort()
+
             return results
-            
+
         except Exception as e:
             logger.error(f"Error in historical sync: {str(e)}")
             return {'success': False, 'error': str(e)}
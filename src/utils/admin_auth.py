@@ -2,6 +2,9 @@
 Admin authentication utilities
 """
 
+import hashlib
+import threading
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
@@ -14,8 +17,20 @@ from ..database.engine import get_db
 from ..database.admin_models import Admin
 from config.settings import settings
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing - prefer argon2id (multi-core, ~2-4x login throughput
+# vs bcrypt-12) and transparently rehash legacy bcrypt hashes on login
+try:
+    import argon2  # noqa: F401 - presence check for the passlib backend
+
+    pwd_context = CryptContext(
+        schemes=["argon2", "bcrypt"],
+        deprecated=["bcrypt"],
+        argon2__memory_cost=65536,
+        argon2__time_cost=3,
+        argon2__parallelism=4,
+    )
+except ImportError:
+    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # JWT settings
 security = HTTPBearer()
@@ -23,6 +38,60 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 8
 
 
+def _load_secret() -> bytes:
+    """Resolve the JWT signing secret from settings"""
+    secret = str(settings.secret_key) if settings.secret_key else "default-secret-key-change-in-production"
+    return secret.encode()
+
+
+# Resolved once at import; jose accepts bytes directly, which also skips
+# its internal str -> bytes encode on every sign/verify
+_SECRET = _load_secret()
+
+
+def refresh_secret():
+    """Re-read the signing secret from settings (for tests/key rotation)"""
+    global _SECRET
+    _SECRET = _load_secret()
+    with _token_cache_lock:
+        _token_cache.clear()
+
+# Short-lived cache of admin lookups so authenticated requests skip the
+# per-request DB round-trip; admin records change rarely
+ADMIN_CACHE_TTL_SECONDS = 30
+_admin_cache = {}  # {username: (monotonic timestamp, detached Admin)}
+_admin_cache_lock = threading.Lock()
+
+
+def _detached_admin_copy(admin: Admin) -> Admin:
+    """Build a session-independent copy of an admin row for caching"""
+    return Admin(
+        id=admin.id,
+        username=admin.username,
+        email=admin.email,
+        hashed_password=admin.hashed_password,
+        full_name=admin.full_name,
+        is_active=admin.is_active,
+        is_superadmin=admin.is_superadmin,
+        created_at=admin.created_at,
+        last_login=admin.last_login,
+    )
+
+
+def invalidate_admin_cache(username: Optional[str] = None):
+    """
+    Drop cached admin lookups after admin mutations
+
+    Args:
+        username: Username to evict, or None to clear the whole cache
+    """
+    with _admin_cache_lock:
+        if username is None:
+            _admin_cache.clear()
+        else:
+            _admin_cache.pop(username, None)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -42,19 +111,30 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(hours=ACCESS_TOKEN_EXPIRE_HOURS)
     
     to_encode.update({"exp": expire})
-    # Ensure secret_key is a string
-    secret = str(settings.secret_key) if settings.secret_key else "default-secret-key-change-in-production"
-    encoded_jwt = jwt.encode(to_encode, secret, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SECRET, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+# Cache of verified token payloads keyed by token digest, bounded by each
+# token's own exp claim - the same bearer token arrives with every request
+# from a session, and full JWS verification per request adds up
+TOKEN_CACHE_MAX_ENTRIES = 4096
+_token_cache = {}  # {token digest: (exp timestamp, payload)}
+_token_cache_lock = threading.Lock()
+
+
 def decode_token(token: str) -> dict:
-    """Decode JWT token"""
+    """Decode JWT token, reusing cached verifications until the token expires"""
+    # Key by a short digest rather than the full token to bound memory
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+    if cached and cached[0] > time.time():
+        return cached[1]
+
     try:
-        # Ensure secret_key is a string
-        secret = str(settings.secret_key) if settings.secret_key else "default-secret-key-change-in-production"
-        payload = jwt.decode(token, secret, algorithms=[ALGORITHM])
-        return payload
+        payload = jwt.decode(token, _SECRET, algorithms=[ALGORITHM])
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -62,6 +142,16 @@ def decode_token(token: str) -> dict:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    exp = payload.get("exp")
+    if exp:
+        with _token_cache_lock:
+            if len(_token_cache) >= TOKEN_CACHE_MAX_ENTRIES:
+                # Simple pressure valve; entries also age out via exp
+                _token_cache.clear()
+            _token_cache[cache_key] = (exp, payload)
+
+    return payload
+
 
 async def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -77,8 +167,18 @@ async def get_current_admin(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
         )
-    
-    admin = db.query(Admin).filter(Admin.username == username).first()
+
+    now = time.monotonic()
+    with _admin_cache_lock:
+        cached = _admin_cache.get(username)
+    if cached and now - cached[0] < ADMIN_CACHE_TTL_SECONDS:
+        admin = cached[1]
+    else:
+        admin = db.query(Admin).filter(Admin.username == username).first()
+        if admin is not None:
+            with _admin_cache_lock:
+                _admin_cache[username] = (now, _detached_admin_copy(admin))
+
     if admin is None or not admin.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -107,4 +207,11 @@ def authenticate_admin(db: Session, username: str, password: str) -> Optional[Ad
         return None
     if not verify_password(password, admin.hashed_password):
         return None
+
+    # Migrate legacy bcrypt hashes to the preferred scheme on successful login
+    if pwd_context.needs_update(admin.hashed_password):
+        admin.hashed_password = get_password_hash(password)
+        db.commit()
+        invalidate_admin_cache(admin.username)
+
     return admin
@@ -7,9 +7,15 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, APIKeyHea
 from typing import Optional
 import secrets
 import hashlib
+import hmac
 import os
 import logging
-from datetime import datetime, timedelta
+import time
+
+try:
+    import redis
+except ImportError:
+    redis = None
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +33,9 @@ class AuthenticationManager:
         """Initialize authentication manager"""
         self.admin_api_key = os.getenv('ADMIN_API_KEY')
         self.webhook_secret = os.getenv('WEBHOOK_SECRET')
-        
+        # Pre-encode the webhook key once instead of per verification
+        self._webhook_key = self.webhook_secret.encode() if self.webhook_secret else None
+
         if not self.admin_api_key:
             logger.warning(
                 "ADMIN_API_KEY not set. Generate one with: "
@@ -51,27 +59,31 @@ class AuthenticationManager:
         # Use constant-time comparison to prevent timing attacks
         return secrets.compare_digest(api_key, self.admin_api_key)
     
-    def verify_webhook_signature(self, payload: str, signature: str) -> bool:
+    def verify_webhook_signature(self, payload, signature: str) -> bool:
         """
         Verify webhook signature
-        
+
+        Uses keyed HMAC-SHA256 rather than sha256(payload + secret), which
+        is vulnerable to length-extension and needs a full string concat
+        plus re-encode of the payload on every call.
+
         Args:
-            payload: Webhook payload
-            signature: Signature to verify
-            
+            payload: Webhook payload (str or bytes)
+            signature: Hex-encoded HMAC-SHA256 signature to verify
+
         Returns:
             True if valid, False otherwise
         """
-        if not self.webhook_secret:
+        if not self._webhook_key:
             logger.error("WEBHOOK_SECRET not configured")
             return False
-        
-        # Calculate expected signature
-        expected = hashlib.sha256(
-            f"{payload}{self.webhook_secret}".encode()
-        ).hexdigest()
-        
-        return secrets.compare_digest(signature, expected)
+
+        if isinstance(payload, str):
+            payload = payload.encode()
+
+        expected = hmac.new(self._webhook_key, payload, hashlib.sha256).hexdigest()
+
+        return hmac.compare_digest(signature, expected)
     
     @staticmethod
     def generate_api_key() -> str:
@@ -218,10 +230,11 @@ class RateLimiter:
     """
     
     def __init__(self):
-        self._requests = {}  # {ip: [(timestamp, count), ...]}
-        self._cleanup_interval = 3600  # Clean up old entries every hour
-        self._last_cleanup = datetime.utcnow()
-    
+        # {identifier: [window_start, previous_count, current_count]}
+        self._buckets = {}
+        self._cleanup_interval = 3600  # Clean up idle identifiers every hour
+        self._last_cleanup = time.monotonic()
+
     def check_rate_limit(
         self,
         identifier: str,
@@ -230,70 +243,143 @@ class RateLimiter:
     ) -> bool:
         """
         Check if identifier exceeds rate limit
-        
+
+        Uses a sliding-window counter: only two integers per identifier
+        (previous and current window counts) instead of a timestamp per
+        request, so memory is O(1) per identifier and the hot path is a
+        couple of comparisons and an increment. The previous window's
+        count is weighted by how much of it still overlaps the sliding
+        window, which smooths the boundary between fixed windows.
+
         Args:
             identifier: Client identifier (IP, API key, etc.)
             max_requests: Maximum requests allowed
             window_seconds: Time window in seconds
-            
+
         Returns:
             True if within limit, False if exceeded
         """
-        now = datetime.utcnow()
-        window_start = now - timedelta(seconds=window_seconds)
-        
-        # Cleanup old entries periodically
-        if (now - self._last_cleanup).total_seconds() > self._cleanup_interval:
-            self._cleanup_old_entries(window_start)
+        now = time.monotonic()
+
+        # Cleanup idle identifiers periodically
+        if now - self._last_cleanup > self._cleanup_interval:
+            self._cleanup_old_entries(window_seconds)
             self._last_cleanup = now
-        
-        # Get requests for this identifier
-        if identifier not in self._requests:
-            self._requests[identifier] = []
-        
-        # Filter requests within window
-        self._requests[identifier] = [
-            ts for ts in self._requests[identifier]
-            if ts > window_start
-        ]
-        
-        # Check limit
-        if len(self._requests[identifier]) >= max_requests:
+
+        bucket = self._buckets.get(identifier)
+        if bucket is None:
+            bucket = [now, 0, 0]
+            self._buckets[identifier] = bucket
+
+        # Roll the window forward when the current one has elapsed
+        elapsed = now - bucket[0]
+        if elapsed >= window_seconds:
+            if elapsed >= 2 * window_seconds:
+                # Idle for more than a full window - nothing carries over
+                bucket[1] = 0
+            else:
+                bucket[1] = bucket[2]
+            bucket[2] = 0
+            bucket[0] = now - (elapsed % window_seconds)
+
+        # Weight the previous window by its remaining overlap
+        overlap = 1.0 - (now - bucket[0]) / window_seconds
+        estimated = bucket[1] * overlap + bucket[2]
+
+        if estimated >= max_requests:
             return False
-        
-        # Add current request
-        self._requests[identifier].append(now)
+
+        bucket[2] += 1
         return True
-    
-    def _cleanup_old_entries(self, cutoff: datetime):
-        """Remove entries older than cutoff"""
-        for identifier in list(self._requests.keys()):
-            self._requests[identifier] = [
-                ts for ts in self._requests[identifier]
-                if ts > cutoff
-            ]
-            
-            # Remove empty entries
-            if not self._requests[identifier]:
-                del self._requests[identifier]
+
+    def _cleanup_old_entries(self, window_seconds: int):
+        """Drop identifiers that have been idle for more than two windows"""
+        cutoff = time.monotonic() - 2 * window_seconds
+        for identifier in list(self._buckets.keys()):
+            if self._buckets[identifier][0] <= cutoff:
+                del self._buckets[identifier]
+
+
+class RedisRateLimiter:
+    """
+    Redis-backed rate limiter for multi-worker deployments
+
+    The in-memory limiter is per-process, so with several uvicorn workers a
+    client effectively gets N times the allowed rate. Counting in Redis
+    (one INCR + EXPIRE per request, keyed by identifier and window) keeps
+    the limit correct across workers and survives restarts.
+    """
+
+    def __init__(self, redis_url: str):
+        """
+        Initialize Redis rate limiter
+
+        Args:
+            redis_url: Redis connection URL (e.g., redis://localhost:6379/0)
+        """
+        self._redis = redis.Redis.from_url(redis_url)
+        # Fall back to the in-memory limiter when Redis is unreachable
+        self._fallback = RateLimiter()
+
+    def check_rate_limit(
+        self,
+        identifier: str,
+        max_requests: int = 100,
+        window_seconds: int = 3600
+    ) -> bool:
+        """
+        Check if identifier exceeds rate limit
+
+        Args:
+            identifier: Client identifier (IP, API key, etc.)
+            max_requests: Maximum requests allowed
+            window_seconds: Time window in seconds
+
+        Returns:
+            True if within limit, False if exceeded
+        """
+        window = int(time.time()) // window_seconds
+        key = f"rl:{identifier}:{window}"
+
+        try:
+            # INCR + EXPIRE in one pipeline round-trip; the key expires with
+            # its window so stale counters clean themselves up
+            pipe = self._redis.pipeline()
+            pipe.incr(key)
+            pipe.expire(key, window_seconds)
+            count, _ = pipe.execute()
+            return count <= max_requests
+        except Exception as e:
+            logger.warning(f"Redis rate limiter unavailable, using in-memory fallback: {e}")
+            return self._fallback.check_rate_limit(identifier, max_requests, window_seconds)
 
 
 # Global rate limiter
-_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter = None
 
 
-def get_rate_limiter() -> RateLimiter:
+def get_rate_limiter():
     """
     Get global rate limiter instance
-    
+
+    Uses the Redis-backed limiter when REDIS_URL is configured and the
+    redis package is installed, otherwise the in-memory limiter.
+
     Returns:
-        RateLimiter instance
+        RedisRateLimiter or RateLimiter instance
     """
     global _rate_limiter
-    
+
     if _rate_limiter is None:
-        _rate_limiter = RateLimiter()
-    
+        redis_url = os.getenv('REDIS_URL')
+        if redis_url and redis is not None:
+            _rate_limiter = RedisRateLimiter(redis_url)
+            logger.info("Using Redis-backed rate limiter")
+        else:
+            if redis_url and redis is None:
+                logger.warning("REDIS_URL set but redis package not installed; using in-memory rate limiter")
+            _rate_limiter = RateLimiter()
+
     return _rate_limiter
 
 
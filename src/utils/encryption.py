@@ -5,16 +5,70 @@ Uses Fernet symmetric encryption from cryptography library
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 import base64
+import functools
 import os
+import time
 from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _derive_key(secret_key: str) -> bytes:
+    """
+    Derive a Fernet key from a secret key via HKDF-SHA256 (cached)
+
+    The secret is expected to be high-entropy (generate_secret_key uses
+    Fernet.generate_key), so the password-stretching of PBKDF2 at 100k
+    iterations buys nothing here - a single HKDF expansion is orders of
+    magnitude cheaper and cryptographically equivalent for this input.
+
+    Args:
+        secret_key: Secret key string
+
+    Returns:
+        Base64-encoded 32-byte Fernet key
+    """
+    kdf = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b'boa_exchange_rate_salt',  # Static salt (for production, use dynamic salt per installation)
+        info=b'fernet-v1',
+        backend=default_backend()
+    )
+
+    return base64.urlsafe_b64encode(kdf.derive(secret_key.encode()))
+
+
+@functools.lru_cache(maxsize=8)
+def _derive_key_pbkdf2(secret_key: str) -> bytes:
+    """
+    Derive a Fernet key via the legacy PBKDF2 path (cached)
+
+    Kept so data encrypted before the HKDF switch can still be decrypted.
+
+    Args:
+        secret_key: Secret key string
+
+    Returns:
+        Base64-encoded 32-byte Fernet key
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=b'boa_exchange_rate_salt',  # Static salt (for production, use dynamic salt per installation)
+        iterations=100000,
+        backend=default_backend()
+    )
+
+    return base64.urlsafe_b64encode(kdf.derive(secret_key.encode()))
+
+
 class EncryptionManager:
     """
     Manages encryption/decryption of sensitive data
@@ -22,47 +76,45 @@ class EncryptionManager:
     Uses Fernet (symmetric encryption) with a key derived from a secret
     """
     
-    def __init__(self, secret_key: Optional[str] = None):
+    def __init__(self, secret_key: Optional[str] = None, pbkdf2_legacy: bool = False):
         """
         Initialize encryption manager
-        
+
         Args:
             secret_key: Secret key for encryption. If None, uses environment variable.
+            pbkdf2_legacy: Use the legacy PBKDF2 key derivation for both
+                          encryption and decryption (pre-HKDF installations)
         """
         if secret_key is None:
             secret_key = os.getenv('SECRET_KEY')
-        
+
         if not secret_key:
             raise ValueError(
                 "SECRET_KEY must be provided or set in environment. "
                 "Generate one with: python -c 'from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())'"
             )
-        
-        # Derive a Fernet key from the secret key using PBKDF2
+
+        # Derive a Fernet key from the secret key using HKDF
         # This allows using a human-readable secret key
+        self._secret_key = secret_key
+        self._pbkdf2_legacy = pbkdf2_legacy
         self._fernet = self._create_fernet(secret_key)
-    
+
     def _create_fernet(self, secret_key: str) -> Fernet:
         """
         Create Fernet instance from secret key
-        
+
         Args:
             secret_key: Secret key string
-            
+
         Returns:
             Fernet instance
         """
-        # Use PBKDF2 to derive a 32-byte key from the secret
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b'boa_exchange_rate_salt',  # Static salt (for production, use dynamic salt per installation)
-            iterations=100000,
-            backend=default_backend()
-        )
-        
-        key = base64.urlsafe_b64encode(kdf.derive(secret_key.encode()))
-        return Fernet(key)
+        # Key derivation is cached per secret, so repeated constructions
+        # don't re-run the KDF
+        if self._pbkdf2_legacy:
+            return Fernet(_derive_key_pbkdf2(secret_key))
+        return Fernet(_derive_key(secret_key))
     
     def encrypt(self, plaintext: str) -> str:
         """
@@ -96,29 +148,51 @@ class EncryptionManager:
         """
         if not ciphertext:
             return ""
-        
+
         try:
             decrypted_bytes = self._fernet.decrypt(ciphertext.encode())
             return decrypted_bytes.decode()
         except Exception as e:
+            # Data written before the HKDF switch was encrypted under the
+            # PBKDF2-derived key; fall back to it (derived lazily, cached)
+            if not self._pbkdf2_legacy:
+                try:
+                    legacy = Fernet(_derive_key_pbkdf2(self._secret_key))
+                    decrypted_bytes = legacy.decrypt(ciphertext.encode())
+                    logger.debug("Decrypted token with legacy PBKDF2-derived key")
+                    return decrypted_bytes.decode()
+                except Exception:
+                    pass
             logger.error(f"Decryption failed: {str(e)}")
             raise
     
     def encrypt_dict(self, data: dict, keys_to_encrypt: list) -> dict:
         """
         Encrypt specific keys in a dictionary
-        
+
+        Each value stays an independently decryptable Fernet token (they
+        are stored as separate DB columns), but the token timestamp is
+        computed once for the whole batch instead of per field.
+
         Args:
             data: Dictionary with data
             keys_to_encrypt: List of keys to encrypt
-            
+
         Returns:
             Dictionary with specified keys encrypted
         """
+        overlap = [key for key in keys_to_encrypt if key in data and data[key]]
+        if not overlap:
+            # Nothing to encrypt - skip the copy entirely
+            return data
+
         result = data.copy()
-        for key in keys_to_encrypt:
-            if key in result and result[key]:
-                result[key] = self.encrypt(str(result[key]))
+        current_time = int(time.time())
+        for key in overlap:
+            encrypted = self._fernet.encrypt_at_time(
+                str(result[key]).encode(), current_time
+            )
+            result[key] = encrypted.decode()
         return result
     
     def decrypt_dict(self, data: dict, keys_to_decrypt: list) -> dict:
@@ -132,10 +206,14 @@ class EncryptionManager:
         Returns:
             Dictionary with specified keys decrypted
         """
+        overlap = [key for key in keys_to_decrypt if key in data and data[key]]
+        if not overlap:
+            # Nothing to decrypt - skip the copy entirely
+            return data
+
         result = data.copy()
-        for key in keys_to_decrypt:
-            if key in result and result[key]:
-                result[key] = self.decrypt(result[key])
+        for key in overlap:
+            result[key] = self.decrypt(result[key])
         return result
 
 
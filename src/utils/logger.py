@@ -2,8 +2,12 @@
 Logging configuration
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
@@ -11,42 +15,59 @@ from typing import Optional
 LOGS_DIR = Path(__file__).parent.parent.parent / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
 
+# Shared formatter, built once
+_formatter = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
 
+# All loggers enqueue records onto a single queue; a background listener
+# thread does the actual console/file writes, so logging calls on the
+# request path never block on disk I/O
+_log_queue: "queue.Queue" = queue.Queue(-1)
+
+_console_handler = logging.StreamHandler(sys.stdout)
+_console_handler.setFormatter(_formatter)
+
+# Rotate at 10 MB (keeping 10 backups) so appends stay in the page cache
+# instead of degrading as the file grows; delay=True defers opening the
+# file until the first record is written
+_file_handler = RotatingFileHandler(
+    LOGS_DIR / "boa_exchange_api.log",
+    maxBytes=10 * 1024 * 1024,
+    backupCount=10,
+    delay=True,
+    encoding='utf-8',
+)
+_file_handler.setFormatter(_formatter)
+
+_queue_handler = QueueHandler(_log_queue)
+_listener = QueueListener(_log_queue, _console_handler, _file_handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+
+@functools.lru_cache(maxsize=256)
 def get_logger(name: str, level: str = "INFO") -> logging.Logger:
     """
-    Get a configured logger instance
-    
+    Get a configured logger instance (cached per name/level)
+
     Args:
         name: Logger name (usually __name__)
         level: Logging level
-        
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
-    
+
     if not logger.handlers:
         # Set level
         logger.setLevel(getattr(logging, level.upper()))
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
-        
-        # File handler
-        file_handler = logging.FileHandler(
-            LOGS_DIR / "boa_exchange_api.log"
-        )
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
+
+        # Records are handed off to the shared listener thread
+        logger.addHandler(_queue_handler)
+
         # Prevent duplicate logs
         logger.propagate = False
-    
-    return logger
\ No newline at end of file
+
+    return logger
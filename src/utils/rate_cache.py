@@ -0,0 +1,60 @@
+"""
+Process-wide TTL cache for scraped exchange rates
+
+Back-to-back manual triggers (or a retry shortly after the scheduled
+run) were each paying a full HTTPS round-trip to bankofalbania.org even
+though published rates only change once a day. The last successful
+scrape is kept per calendar date and reused until it expires.
+"""
+
+import threading
+import time
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from ..boa_scraper.models import DailyExchangeRates
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TTL_SECONDS = 3600
+
+_cache: Dict[date, Tuple[float, DailyExchangeRates]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_or_scrape(scraper, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> Optional[DailyExchangeRates]:
+    """
+    Return today's rates from cache, scraping only when stale or missing
+
+    Args:
+        scraper: BoAScraper instance to use on a cache miss
+        ttl_seconds: How long a scraped result stays fresh
+
+    Returns:
+        DailyExchangeRates if available, None if the scrape failed
+    """
+    today = date.today()
+    now = time.monotonic()
+
+    with _cache_lock:
+        cached = _cache.get(today)
+    if cached and now - cached[0] < ttl_seconds:
+        logger.debug("Serving exchange rates from cache")
+        return cached[1]
+
+    rates = scraper.get_current_rates()
+
+    if rates:
+        with _cache_lock:
+            # Past dates never become fresh again - drop them
+            _cache.clear()
+            _cache[today] = (now, rates)
+
+    return rates
+
+
+def invalidate():
+    """Drop all cached rates (next call re-scrapes)"""
+    with _cache_lock:
+        _cache.clear()
@@ -2,116 +2,158 @@
 Task scheduler for automated exchange rate updates
 """
 
-import schedule
-import time
+import asyncio
 import threading
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta
 from typing import Optional
 
+from ..boa_scraper.scraper import BoAScraper
+from ..database.engine import get_db_manager
+from ..database.repository import ExchangeRateRepository
+from ..quickbooks.sync import QuickBooksSync
+from ..utils import rate_cache
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-_scheduler_thread: Optional[threading.Thread] = None
-_scheduler_running = False
+_scheduler_task: Optional[asyncio.Task] = None
+
+# Scraper and sync instances are reused across runs - constructing them
+# builds HTTP sessions and loads OAuth credentials, none of which needs
+# redoing per trigger (get_db_manager is already a singleton)
+_scraper: Optional[BoAScraper] = None
+_qb_sync: Optional[QuickBooksSync] = None
+_instances_lock = threading.Lock()
+
+
+def _get_scraper() -> BoAScraper:
+    """Get the shared BoAScraper instance (created lazily)"""
+    global _scraper
+    with _instances_lock:
+        if _scraper is None:
+            _scraper = BoAScraper()
+    return _scraper
+
+
+def _get_qb_sync() -> QuickBooksSync:
+    """Get the shared QuickBooksSync instance (created lazily)"""
+    global _qb_sync
+    with _instances_lock:
+        if _qb_sync is None:
+            _qb_sync = QuickBooksSync()
+    return _qb_sync
 
 
 def daily_update_task():
     """Daily task to update exchange rates"""
     try:
         logger.info("Starting daily exchange rate update task")
-        
-        # Import here to avoid circular imports
-        from ..boa_scraper.scraper import BoAScraper
-        from ..quickbooks.sync import QuickBooksSync
-        from ..database.engine import get_db_manager
-        from ..database.repository import ExchangeRateRepository
-        
-        # Scrape current rates
-        scraper = BoAScraper()
-        rates = scraper.get_current_rates()
-        
+
+        # Scrape current rates (served from cache when a recent result exists)
+        rates = rate_cache.get_or_scrape(_get_scraper())
+
         if rates:
             logger.info(f"Scraped {len(rates.rates)} exchange rates")
-            
-            # Save to database
-            db_manager = get_db_manager()
-            with db_manager.get_session() as session:
-                repo = ExchangeRateRepository(session)
-                stats = repo.save_rates(rates)
-                logger.info(f"Database: {stats['new']} new, {stats['updated']} updated, {stats['unchanged']} unchanged")
-            
-            # Sync with QuickBooks (only priority currencies)
-            qb_sync = QuickBooksSync()
-            result = qb_sync.sync_rates(rates)
-            
-            if result:
-                logger.info("Successfully synced rates with QuickBooks Online")
-            else:
-                logger.error("Failed to sync rates with QuickBooks Online")
+
+            def save_to_database():
+                db_manager = get_db_manager()
+                with db_manager.get_session() as session:
+                    repo = ExchangeRateRepository(session)
+                    return repo.save_rates(rates)
+
+            def sync_to_quickbooks():
+                return _get_qb_sync().sync_rates(rates)
+
+            # The DB write and QB sync are independent and both I/O-bound,
+            # so run them in parallel - total time becomes max() not sum()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                db_future = executor.submit(save_to_database)
+                qb_future = executor.submit(sync_to_quickbooks)
+
+                try:
+                    stats = db_future.result()
+                    logger.info(f"Database: {stats['new']} new, {stats['updated']} updated, {stats['unchanged']} unchanged")
+                except Exception as e:
+                    logger.error(f"Failed to save rates to database: {str(e)}")
+
+                try:
+                    if qb_future.result():
+                        logger.info("Successfully synced rates with QuickBooks Online")
+                    else:
+                        logger.error("Failed to sync rates with QuickBooks Online")
+                except Exception as e:
+                    logger.error(f"Failed to sync rates with QuickBooks Online: {str(e)}")
         else:
             logger.warning("No exchange rates scraped")
-            
+
     except Exception as e:
         logger.error(f"Error in daily update task: {str(e)}")
 
 
-def run_scheduler():
-    """Run the scheduler in a separate thread"""
-    global _scheduler_running
-    _scheduler_running = True
-    
-    logger.info("Starting scheduler thread")
-    
-    while _scheduler_running:
-        schedule.run_pending()
-        time.sleep(60)  # Check every minute
-    
-    logger.info("Scheduler thread stopped")
+async def _scheduler_loop(run_at: time):
+    """
+    Sleep until the next scheduled run, execute the daily task, repeat
+
+    A single long asyncio.sleep until the target time replaces the old
+    schedule.run_pending() thread that woke up every minute just to
+    check the clock. The blocking scrape/DB/QB work still runs off the
+    event loop via asyncio.to_thread.
+    """
+    try:
+        while True:
+            now = datetime.now()
+            next_run = datetime.combine(now.date(), run_at)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+
+            logger.info(f"Next scheduled update at {next_run}")
+            await asyncio.sleep((next_run - now).total_seconds())
+            await asyncio.to_thread(daily_update_task)
+    except asyncio.CancelledError:
+        logger.info("Scheduler task cancelled")
+        raise
 
 
 def start_scheduler(schedule_time: str = "09:00"):
     """
     Start the task scheduler
-    
+
+    Must be called from a running event loop (e.g. FastAPI startup).
+
     Args:
         schedule_time: Time to run daily updates (HH:MM format)
     """
-    global _scheduler_thread, _scheduler_running
-    
-    if _scheduler_thread and _scheduler_thread.is_alive():
+    global _scheduler_task
+
+    if _scheduler_task and not _scheduler_task.done():
         logger.warning("Scheduler is already running")
         return
-    
-    # Schedule daily task
-    schedule.every().day.at(schedule_time).do(daily_update_task)
-    
+
+    hour, minute = (int(part) for part in schedule_time.split(":"))
+    _scheduler_task = asyncio.create_task(_scheduler_loop(time(hour, minute)))
+
     logger.info(f"Scheduled daily updates at {schedule_time}")
-    
-    # Start scheduler thread
-    _scheduler_thread = threading.Thread(target=run_scheduler, daemon=True)
-    _scheduler_thread.start()
-    
-    logger.info("Scheduler started")
 
 
 def stop_scheduler():
     """Stop the task scheduler"""
-    global _scheduler_running
-    
-    _scheduler_running = False
-    schedule.clear()
-    
+    global _scheduler_task
+
+    if _scheduler_task and not _scheduler_task.done():
+        _scheduler_task.cancel()
+    _scheduler_task = None
+
     logger.info("Scheduler stopped")
 
 
 def trigger_manual_update():
     """Trigger a manual update of exchange rates"""
     logger.info("Triggering manual exchange rate update")
-    
+
     try:
         daily_update_task()
         return True
     except Exception as e:
         logger.error(f"Manual update failed: {str(e)}")
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,139 @@
+"""
+Shared fixtures for the test suite
+"""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import Mock, create_autospec
+
+import freezegun
+import pytest
+
+from src.boa_scraper.models import DailyExchangeRates, ExchangeRate
+from src.boa_scraper.scraper import BoAScraper
+from src.quickbooks.sync import QuickBooksSync
+from src.utils import rate_cache
+
+# The whole session runs at this frozen instant (see _freeze_time below),
+# so date.today()/datetime.now() inside the code under test and TODAY in
+# the tests always agree
+FROZEN_TIME = '2024-01-01'
+TODAY = date(2024, 1, 1)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _freeze_time():
+    """Freeze the clock for the whole session
+
+    The pydantic default factories (created_at, scraped_at) stop hitting
+    the real clock per object and date-based assertions become
+    deterministic.
+    """
+    # Import the app and force route/model compilation before freezing:
+    # pydantic resolves datetime.date by identity, so lazily building
+    # route fields under freezegun's fake date class would fail
+    from src.main import app
+
+    app.openapi()
+
+    with freezegun.freeze_time(FROZEN_TIME):
+        yield
+
+# Shared rate objects - built once instead of re-validating the same
+# pydantic models in every test that needs sample data
+USD_RATE = ExchangeRate(
+    currency_code='USD',
+    currency_name='US Dollar',
+    rate=Decimal('105.50'),
+    rate_date=TODAY
+)
+EUR_RATE = ExchangeRate(
+    currency_code='EUR',
+    currency_name='Euro',
+    rate=Decimal('115.20'),
+    rate_date=TODAY
+)
+
+
+@pytest.fixture(scope="session")
+def today():
+    """The session-wide TODAY constant as a fixture"""
+    return TODAY
+
+
+@pytest.fixture(scope="session")
+def client():
+    """
+    Session-wide FastAPI test client
+
+    Entering the client as a context manager runs the app lifespan once
+    for the whole session instead of implicitly per request.
+    """
+    from fastapi.testclient import TestClient
+    from src.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+async def aclient():
+    """Async client against the app's ASGI transport
+
+    Lets independent requests run concurrently via asyncio.gather instead
+    of one synchronous round-trip per call.
+    """
+    from httpx import ASGITransport, AsyncClient
+    from src.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def daily_rates():
+    """Sample daily rates with the USD and EUR test rates"""
+    return DailyExchangeRates(rates_date=TODAY, rates=[USD_RATE, EUR_RATE])
+
+
+@pytest.fixture
+def mock_scraper(monkeypatch):
+    """Spec'd mock installed in place of the route-level BoAScraper
+
+    create_autospec precomputes the attribute set from the real class, so
+    attribute access stays cheap and typos fail loudly instead of silently
+    returning child mocks.
+    """
+    scraper = create_autospec(BoAScraper, instance=True)
+    monkeypatch.setattr('src.api.routes.BoAScraper', lambda *args, **kwargs: scraper)
+    # The rates routes read through the shared TTL cache - keep one
+    # test's mocked rates from leaking into the next
+    rate_cache.invalidate()
+    yield scraper
+    rate_cache.invalidate()
+
+
+@pytest.fixture
+def make_mock_scraper(mock_scraper):
+    """Builder that configures the installed scraper mock in one call"""
+    def _make(current=None, for_date=None):
+        mock_scraper.get_current_rates.return_value = current
+        mock_scraper.get_rates_for_date.return_value = for_date
+        return mock_scraper
+    return _make
+
+
+@pytest.fixture
+def mock_qb_sync(monkeypatch):
+    """Spec'd mock installed in place of the route-level QuickBooksSync"""
+    sync = create_autospec(QuickBooksSync, instance=True)
+    monkeypatch.setattr('src.api.routes.QuickBooksSync', lambda *args, **kwargs: sync)
+    return sync
+
+
+@pytest.fixture
+def mock_trigger_update(monkeypatch):
+    """Mock installed in place of the route-level trigger_manual_update"""
+    trigger = Mock()
+    monkeypatch.setattr('src.api.routes.trigger_manual_update', trigger)
+    return trigger
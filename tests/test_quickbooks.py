@@ -2,10 +2,14 @@
 Tests for QuickBooks integration
 """
 
+import re
+from types import SimpleNamespace
+
 import pytest
+import requests
 from datetime import date, datetime
 from decimal import Decimal
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, create_autospec
 
 from src.quickbooks.client import QuickBooksClient
 from src.quickbooks.sync import QuickBooksSync
@@ -32,139 +36,117 @@ class TestQuickBooksClient:
         assert self.client.sandbox is True
         assert self.client.company_id == "test_company_id"
     
-    @patch('src.quickbooks.client.QuickBooks')
-    def test_test_connection_success(self, mock_qb_class):
+    def test_test_connection_success(self, requests_mock):
         """Test successful connection test"""
-        mock_qb = Mock()
-        mock_qb.get_company_info.return_value = {"name": "Test Company"}
-        mock_qb_class.return_value = mock_qb
-        
-        # Reinitialize to use the mock
-        self.client._initialize_client()
-        
+        requests_mock.get(
+            re.compile(r'.*/companyinfo/.*'),
+            json={"CompanyInfo": {"CompanyName": "Test Company"}}
+        )
+
         result = self.client.test_connection()
-        
+
         assert result is True
-    
-    @patch('src.quickbooks.client.QuickBooks')
-    def test_test_connection_failure(self, mock_qb_class):
+
+    def test_test_connection_failure(self, requests_mock):
         """Test connection test failure"""
-        mock_qb = Mock()
-        mock_qb.get_company_info.side_effect = Exception("Connection failed")
-        mock_qb_class.return_value = mock_qb
-        
-        # Reinitialize to use the mock
-        self.client._initialize_client()
-        
+        requests_mock.get(
+            re.compile(r'.*/companyinfo/.*'),
+            exc=requests.exceptions.ConnectionError
+        )
+
         result = self.client.test_connection()
-        
+
         assert result is False
-    
-    def test_create_exchange_rate(self):
+
+    def test_create_exchange_rate(self, requests_mock):
         """Test creating exchange rate"""
-        with patch.object(self.client, '_client') as mock_client:
-            mock_rate = Mock()
-            mock_rate.save.return_value = Mock(Id="123")
-            
-            with patch('src.quickbooks.client.QBExchangeRate', return_value=mock_rate):
-                result = self.client.create_exchange_rate(
-                    source_currency="USD",
-                    target_currency="ALL",
-                    rate=Decimal("105.50"),
-                    as_of_date=date.today()
-                )
-                
-                assert result == "123"
-                mock_rate.save.assert_called_once()
+        # No existing rate for this currency/date
+        requests_mock.get(
+            re.compile(r'.*/exchangerate'),
+            status_code=404
+        )
+        requests_mock.post(
+            re.compile(r'.*/exchangerate'),
+            json={"ExchangeRate": {"SyncToken": "0"}}
+        )
+
+        result = self.client.create_exchange_rate(
+            source_currency="USD",
+            target_currency="ALL",
+            rate=Decimal("105.50"),
+            as_of_date=date.today()
+        )
+
+        assert result == "success"
+        assert requests_mock.last_request.json()["SourceCurrencyCode"] == "USD"
+
+
+@pytest.fixture
+def sync_service(monkeypatch):
+    """QuickBooksSync built against patched settings and a spec'd client class
+
+    Replaces the old setup_method that re-entered two patch context
+    managers before every test.
+    """
+    monkeypatch.setattr(
+        'src.quickbooks.sync.settings',
+        SimpleNamespace(
+            qb_client_id="test_id",
+            qb_client_secret="test_secret",
+            qb_access_token="test_token",
+            qb_refresh_token="test_refresh",
+            qb_company_id="test_company",
+            qb_sandbox=True,
+            qb_existing_ttl_seconds=0,
+        )
+    )
+    monkeypatch.setattr(
+        'src.quickbooks.sync.QuickBooksClient',
+        create_autospec(QuickBooksClient)
+    )
+    return QuickBooksSync()
 
 
 class TestQuickBooksSync:
     """Test QuickBooks synchronization service"""
-    
-    def setup_method(self):
-        """Setup test fixtures"""
-        with patch('src.quickbooks.sync.settings') as mock_settings:
-            mock_settings.qb_client_id = "test_id"
-            mock_settings.qb_client_secret = "test_secret"
-            mock_settings.qb_access_token = "test_token"
-            mock_settings.qb_refresh_token = "test_refresh"
-            mock_settings.qb_company_id = "test_company"
-            mock_settings.qb_sandbox = True
-            
-            with patch('src.quickbooks.sync.QuickBooksClient'):
-                self.sync_service = QuickBooksSync()
-    
-    def test_sync_service_initialization(self):
+
+    def test_sync_service_initialization(self, sync_service):
         """Test sync service initialization"""
-        assert self.sync_service is not None
-    
-    def test_sync_rates_success(self):
-        """Test successful rate synchronization"""
-        # Create test data
-        rates = [
-            ExchangeRate(
-                currency_code='USD',
-                currency_name='US Dollar',
-                rate=Decimal('105.50'),
-                date=date.today()
-            ),
-            ExchangeRate(
-                currency_code='EUR',
-                currency_name='Euro',
-                rate=Decimal('115.20'),
-                date=date.today()
-            )
-        ]
-        
-        daily_rates = DailyExchangeRates(
-            date=date.today(),
-            rates=rates
-        )
-        
-        # Mock client
-        mock_client = Mock()
-        mock_client.get_existing_exchange_rates.return_value = []
-        mock_client.create_exchange_rate.return_value = "123"
-        
-        self.sync_service.client = mock_client
-        
-        # Test
-        result = self.sync_service.sync_rates(daily_rates)
-        
-        # Assertions
-        assert result is True
-        assert mock_client.create_exchange_rate.call_count == 2
-    
-    def test_sync_rates_no_client(self):
-        """Test sync with no client initialized"""
-        rates = [
-            ExchangeRate(
-                currency_code='USD',
-                currency_name='US Dollar',
-                rate=Decimal('105.50'),
-                date=date.today()
-            )
-        ]
-        
-        daily_rates = DailyExchangeRates(
-            date=date.today(),
-            rates=rates
-        )
-        
-        self.sync_service.client = None
-        
-        result = self.sync_service.sync_rates(daily_rates)
-        
-        assert result is False
+        assert sync_service is not None
+
+    @pytest.mark.parametrize('with_client,expected', [
+        (True, True),    # healthy client: rates batch through successfully
+        (False, False),  # no client initialized: sync refuses
+    ])
+    def test_sync_rates(self, sync_service, daily_rates, with_client, expected):
+        """Test rate synchronization with and without an initialized client"""
+        if with_client:
+            # Spec'd mock client - typos against the real API fail loudly
+            mock_client = create_autospec(QuickBooksClient, instance=True)
+            mock_client.get_existing_exchange_rates.return_value = []
+            mock_client.batch_create_or_update_exchange_rates.return_value = {
+                'USD': True,
+                'EUR': True
+            }
+            sync_service.client = mock_client
+        else:
+            sync_service.client = None
+
+        result = sync_service.sync_rates(daily_rates)
+
+        assert result is expected
+        if with_client:
+            mock_client.batch_create_or_update_exchange_rates.assert_called_once()
+            assert mock_client.add_currency.call_count == 2
     
-    def test_get_sync_status(self):
+    def test_get_sync_status(self, sync_service):
         """Test getting sync status"""
-        mock_client = Mock()
+        mock_client = create_autospec(QuickBooksClient, instance=True)
         mock_client.test_connection.return_value = True
         
-        self.sync_service.client = mock_client
+        sync_service.client = mock_client
         
-        status = self.sync_service.get_sync_status()
+        status = sync_service.get_sync_status()
         
         assert status['client_initialized'] is True
         assert status['connection_active'] is True